@@ -15,7 +15,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
@@ -104,6 +107,25 @@ DIALOG_TITLE_GIT_NOT_FOUND = "Git Not Found"
 DEFAULT_COMMIT_TEMPLATE = "Design update: {filename}"
 DEFAULT_BRANCH_FORMAT = "fusion-export/{filename}-{timestamp}"
 
+# Formats offered in the dialog, and the ones pre-selected for a new repo.
+AVAILABLE_FORMATS = ("f3d", "step", "iges", "sat", "stl")
+DEFAULT_EXPORT_FORMATS = ("f3d", "step", "stl")
+LOG_LEVELS = ("ERROR", "WARNING", "INFO", "DEBUG")
+
+# Text inputs whose handlers (validation, hints, sanitizing) only need the
+# settled value: a burst of keystrokes is collapsed into a single run.
+DEBOUNCED_INPUT_IDS = frozenset(
+    {"newRepoName", "repoPath", "gitUrl", "branchPreview", "exportSubfolder"}
+)
+INPUT_DEBOUNCE_SECONDS = 0.15
+INPUT_SETTLED_EVENT_ID = "PushToGitHub_InputSettled"
+# Events used to run the copy + git pipeline on a worker thread.
+PUSH_COPY_DONE_EVENT_ID = "PushToGitHub_CopyDone"
+PUSH_GIT_DONE_EVENT_ID = "PushToGitHub_GitDone"
+GIT_UI_CALL_EVENT_ID = "PushToGitHub_GitUiCall"
+PUSH_EVENT_IDS = (PUSH_COPY_DONE_EVENT_ID, PUSH_GIT_DONE_EVENT_ID, GIT_UI_CALL_EVENT_ID)
+CUSTOM_EVENT_IDS = (INPUT_SETTLED_EVENT_ID,) + PUSH_EVENT_IDS
+
 FORMAT_SETTINGS_DEFAULT = {
     "stl": {"meshRefinement": "high"},
     "step": {"protocol": "AP214"},
@@ -121,6 +143,16 @@ FORMAT_SETTINGS_OPTIONS = {
     ],
 }
 
+# Settings key edited by each format's dropdown (its first default key).
+FORMAT_STATE_KEY = {
+    fmt: next(iter(defaults), "value")
+    for fmt, defaults in FORMAT_SETTINGS_DEFAULT.items()
+}
+
+# Upper bound on concurrent export copies into the repository.
+MAX_COPY_WORKERS = 8
+PUSH_SUPERSEDED_MESSAGE = "Push superseded by a newer push."
+
 LOG_DIR = os.path.expanduser("~/.PushToGitHub_AddIn_Data")
 LOG_FILE_PATH = os.path.join(LOG_DIR, "PushToGitHub.log")
 
@@ -147,6 +179,47 @@ def temporary_export_dir(parent_dir: Optional[str] = None):
         shutil.rmtree(temp_path, ignore_errors=True)
 
 
+def copy_export_file(src: str, destination_root: str) -> str:
+    """Copy one exported file into the repo and return its destination."""
+    dst = os.path.join(destination_root, os.path.basename(src))
+    shutil.copy2(src, dst)
+    try:
+        size = os.stat(dst).st_size
+    except FileNotFoundError:
+        size = -1
+    if size <= 0:
+        raise RuntimeError(f"Copied file missing/empty:\n{dst}")
+    if logger:
+        logger.info("Copied -> %s (%d bytes)", dst, size)
+    return dst
+
+
+def copy_export_files(
+    sources: list,
+    destination_root: str,
+    cancelled: Optional[threading.Event] = None,
+) -> list:
+    """Copy the exported files concurrently; destinations follow *sources*.
+
+    The copies are I/O bound, so overlapping them hides per-file latency.
+    The first failure cancels the copies that have not started and is
+    re-raised. Setting *cancelled* stops the remaining copies the same way.
+    """
+    copied = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(sources))) as pool:
+        futures = {pool.submit(copy_export_file, src, destination_root): src for src in sources}
+        try:
+            for future in as_completed(futures):
+                copied[futures[future]] = future.result()
+                if cancelled is not None and cancelled.is_set():
+                    raise RuntimeError(PUSH_SUPERSEDED_MESSAGE)
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return [copied[src] for src in sources]
+
+
 def determine_valid_export_formats(
     design: adsk.fusion.Design,
     requested_formats: list
@@ -183,6 +256,17 @@ dialog_handlers = []
 push_cmd_def = None
 git_push_control = None
 is_initialized = False  # guard against double run()
+# Custom events are how background threads hand work back to Fusion's UI
+# thread (app.fireCustomEvent is the one API call safe off that thread).
+# Maps each event id to the callback the current dialog installed for it.
+custom_event_callbacks = {}
+registered_custom_events = []
+# Set when a newer push supersedes the one in flight; the worker checks it
+# between steps. _current_run_id tags that push's completion event and
+# _current_push_thread is that push's worker.
+_current_run_token: Optional[threading.Event] = None
+_current_run_id = 0
+_current_push_thread: Optional[threading.Thread] = None
 current_log_level_name = "INFO"
 
 try:
@@ -462,9 +546,26 @@ def read_stored_pat(repo_identifier: str) -> Optional[dict]:
         CredFree(credential_pp)
 
 
+# repo identifier -> (monotonic read time, read_stored_pat result). Lets the
+# dialog and the push reuse one credential-store read per repository.
+_pat_cache = {}
+PAT_CACHE_TTL_SECONDS = 30.0
+
+
+def read_stored_pat_cached(repo_identifier: str, ttl: float = PAT_CACHE_TTL_SECONDS) -> Optional[dict]:
+    now = time.monotonic()
+    hit = _pat_cache.get(repo_identifier)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    value = read_stored_pat(repo_identifier)
+    _pat_cache[repo_identifier] = (now, value)
+    return value
+
+
 def store_pat(repo_identifier: str, username: str, token: str) -> None:
     if not IS_WINDOWS:
         raise RuntimeError("PAT storage is only supported on Windows.")
+    _pat_cache.pop(repo_identifier, None)
     target_name = _credential_target(repo_identifier)
     blob = token.encode("utf-16-le")
     blob_buffer = ctypes.create_string_buffer(blob)
@@ -490,6 +591,7 @@ def store_pat(repo_identifier: str, username: str, token: str) -> None:
 def delete_pat(repo_identifier: str) -> None:
     if not IS_WINDOWS:
         return
+    _pat_cache.pop(repo_identifier, None)
     target_name = _credential_target(repo_identifier)
     success = CredDeleteW(target_name, CRED_TYPE_GENERIC, 0)
     if not success:
@@ -622,15 +724,27 @@ def ensure_git_identity(
         return True
 
 
+# Canonical JSON of the config as last read from or written to disk, so a
+# push with unchanged settings doesn't rewrite the file.
+_last_saved_snapshot: Optional[str] = None
+
+
+def _config_snapshot(config_data) -> str:
+    return json.dumps(config_data, sort_keys=True)
+
+
 def load_config() -> dict:
-    global logger, ui
+    global logger, ui, _last_saved_snapshot
     if not os.path.exists(CONFIG_PATH):
         with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
             json.dump({}, f)
+        _last_saved_snapshot = _config_snapshot({})
         return {}
     try:
         with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            config_data = json.load(f)
+        _last_saved_snapshot = _config_snapshot(config_data)
+        return config_data
     except json.JSONDecodeError:
         final_ui_ref = ui or (app.userInterface if app else None)
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -650,8 +764,11 @@ def load_config() -> dict:
             logger.error(msg)
         with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
             json.dump({}, f)
+        _last_saved_snapshot = _config_snapshot({})
         return {}
     except Exception as e:
+        # The file's contents are unknown, so the next save must not be skipped.
+        _last_saved_snapshot = None
         msg = f"Error loading config '{CONFIG_PATH}': {str(e)}"
         final_ui_ref = ui or (app.userInterface if app else None)
         if final_ui_ref:
@@ -662,7 +779,7 @@ def load_config() -> dict:
 
 
 def save_config(config_data: dict) -> None:
-    global logger, ui
+    global logger, ui, _last_saved_snapshot
     try:
         # Write-then-rename keeps the config intact if the write is
         # interrupted (the previous corrupt-config recovery path exists,
@@ -671,6 +788,7 @@ def save_config(config_data: dict) -> None:
         with open(temp_path, 'w', encoding='utf-8') as f:
             json.dump(config_data, f, indent=4)
         os.replace(temp_path, CONFIG_PATH)
+        _last_saved_snapshot = _config_snapshot(config_data)
         if logger:
             logger.info(f"Configuration saved to {CONFIG_PATH}")
     except Exception as e:
@@ -682,6 +800,14 @@ def save_config(config_data: dict) -> None:
             logger.error(msg, exc_info=True)
 
 
+def save_config_if_changed(config_data: dict) -> None:
+    if _config_snapshot(config_data) == _last_saved_snapshot:
+        if logger:
+            logger.debug("Configuration unchanged; skipping save.")
+        return
+    save_config(config_data)
+
+
 def get_fusion_design() -> Optional[adsk.fusion.Design]:
     global app, logger
     try:
@@ -749,6 +875,217 @@ class FusionCommandGitUI:
         return result == adsk.core.DialogResults.DialogYes
 
 
+class ThrottledProgress:
+    """Rate-limited view of a Fusion progress dialog.
+
+    Each property write is an API round-trip that repaints the dialog, so
+    value updates arriving within *min_interval* of the previous one are
+    dropped. Reaching the maximum value is never dropped, and neither is a
+    changed message (it is rare and would otherwise stay stale).
+    """
+
+    def __init__(self, dialog, min_interval: float = 0.1):
+        self.dialog = dialog
+        self.min_interval = min_interval
+        self._last_update = 0.0
+        self._message = None
+
+    def set(self, value: int, message: Optional[str] = None) -> None:
+        if message and message != self._message:
+            self._message = message
+            self.dialog.message = message
+        now = time.monotonic()
+        if now - self._last_update < self.min_interval and value < self.dialog.maximumValue:
+            return
+        self._last_update = now
+        self.dialog.progressValue = value
+
+    def finish(self) -> None:
+        self.dialog.progressValue = self.dialog.maximumValue
+        self._last_update = time.monotonic()
+
+    def hide(self) -> None:
+        self.dialog.hide()
+
+
+class UiThreadGitUI:
+    """GitUI for the push worker thread that runs each prompt on the UI thread.
+
+    Fusion's API may only be used from the UI thread, so warn/error/confirm
+    calls are posted there through a custom event while the worker waits
+    for the answer. ``info`` only logs, which is thread-safe. Once
+    *cancelled* is set the push has been superseded: confirm answers no so
+    the worker can unwind without blocking, and warnings/errors are held
+    back until ``show_deferred()`` runs after the worker has finished.
+    """
+
+    def __init__(self, target: FusionCommandGitUI, cancelled: threading.Event):
+        self._target = target
+        self._cancelled = cancelled
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._next_id = 0
+        self._deferred = []
+
+    def _skip_call(self, method_name: str, message: str) -> None:
+        if method_name == "confirm":
+            self._target.info(f"{PUSH_SUPERSEDED_MESSAGE} Dropped: {message}")
+        else:
+            # e.g. "changes remain stashed": the user still needs to see it.
+            with self._lock:
+                self._deferred.append((method_name, message))
+
+    def show_deferred(self) -> None:
+        """Show the warnings/errors held back after supersession (UI thread)."""
+        with self._lock:
+            deferred, self._deferred = self._deferred, []
+        for method_name, message in deferred:
+            getattr(self._target, method_name)(message)
+
+    def _call_on_ui_thread(self, method_name: str, message: str):
+        if self._cancelled.is_set():
+            self._skip_call(method_name, message)
+            return None
+        slot = {"done": threading.Event(), "result": None}
+        with self._lock:
+            self._next_id += 1
+            call_id = str(self._next_id)
+            self._calls[call_id] = (method_name, message, slot)
+        app.fireCustomEvent(GIT_UI_CALL_EVENT_ID, call_id)
+        # A newer push replaces the event callback, so this call may never
+        # be serviced; stop waiting once superseded.
+        while not slot["done"].wait(0.1):
+            if self._cancelled.is_set():
+                with self._lock:
+                    pending = self._calls.pop(call_id, None)
+                if pending is not None:
+                    self._skip_call(method_name, message)
+                    return None
+                # Otherwise the UI thread is already showing it.
+        return slot["result"]
+
+    def run_call(self, call_id: str) -> None:
+        with self._lock:
+            entry = self._calls.pop(call_id, None)
+        if entry is None:
+            return
+        method_name, message, slot = entry
+        try:
+            slot["result"] = getattr(self._target, method_name)(message)
+        finally:
+            slot["done"].set()
+
+    def info(self, message: str) -> None:
+        self._target.info(message)
+
+    def warn(self, message: str) -> None:
+        self._call_on_ui_thread("warn", message)
+
+    def error(self, message: str) -> None:
+        self._call_on_ui_thread("error", message)
+
+    def confirm(self, message: str) -> bool:
+        return bool(self._call_on_ui_thread("confirm", message))
+
+
+def run_push_in_background(run_pipeline, git_ui: FusionCommandGitUI, progress: Optional[ThrottledProgress]):
+    """Run ``run_pipeline(git_ui, report_copied, cancelled)`` on a worker thread.
+
+    The file copies and git subprocesses would otherwise freeze Fusion for
+    the whole push. The UI thread keeps pumping events until the worker is
+    done, which repaints the progress dialog and services the worker's
+    prompts; the caller then handles the result (or the exception, which is
+    re-raised here) exactly as if the pipeline had run inline.
+
+    Starting a push supersedes any push still in flight: its token is set,
+    its worker bails at the next checkpoint and its completion event is
+    ignored. The new worker only starts once the old one has exited, since
+    a worker already inside the git pipeline runs it to the end on the same
+    working tree. A superseded push therefore returns whatever its worker
+    produced: ``{"cancelled": True}`` only if it bailed before pushing.
+    """
+    global _current_run_token, _current_run_id, _current_push_thread
+    if _current_run_token is not None:
+        _current_run_token.set()
+    cancelled = threading.Event()
+    _current_run_token = cancelled
+    _current_run_id += 1
+    run_id = _current_run_id
+
+    previous_thread = _current_push_thread
+    if previous_thread is not None:
+        while previous_thread.is_alive():
+            adsk.doEvents()
+            previous_thread.join(0.05)
+    if cancelled.is_set():
+        # An even newer push started (and ran) while this one was waiting.
+        git_ui.info(PUSH_SUPERSEDED_MESSAGE)
+        return {"cancelled": True}
+
+    bridge = UiThreadGitUI(git_ui, cancelled)
+    outcome = {"result": None, "error": None}
+
+    def on_copy_done(additional_info: str):
+        if progress and additional_info == str(run_id):
+            progress.set(1, "Committing and pushing…")
+
+    def on_git_done(additional_info: str):
+        try:
+            payload = json.loads(additional_info)
+        except ValueError:
+            return
+        if progress and payload.get("run") == run_id:
+            progress.finish()
+
+    def report_copied():
+        app.fireCustomEvent(PUSH_COPY_DONE_EVENT_ID, str(run_id))
+
+    def worker():
+        try:
+            outcome["result"] = run_pipeline(bridge, report_copied, cancelled)
+        except Exception as exc:
+            # Re-raised on the UI thread so the caller reports it as if the
+            # pipeline had raised inline.
+            outcome["error"] = exc
+        finally:
+            if not cancelled.is_set():
+                app.fireCustomEvent(
+                    PUSH_GIT_DONE_EVENT_ID,
+                    json.dumps({"run": run_id, "result": outcome["result"]}),
+                )
+
+    callbacks = {
+        PUSH_COPY_DONE_EVENT_ID: on_copy_done,
+        PUSH_GIT_DONE_EVENT_ID: on_git_done,
+        GIT_UI_CALL_EVENT_ID: bridge.run_call,
+    }
+    custom_event_callbacks.update(callbacks)
+    push_thread = threading.Thread(target=worker, name="PushToGitHubPush", daemon=True)
+    _current_push_thread = push_thread
+    try:
+        push_thread.start()
+        while push_thread.is_alive():
+            adsk.doEvents()
+            push_thread.join(0.05)
+        adsk.doEvents()  # deliver the completion event
+    finally:
+        # A newer push may have installed its own callbacks meanwhile.
+        for event_id, callback in callbacks.items():
+            if custom_event_callbacks.get(event_id) is callback:
+                custom_event_callbacks.pop(event_id)
+        if _current_run_token is cancelled:
+            _current_run_token = None
+        if _current_push_thread is push_thread:
+            _current_push_thread = None
+    bridge.show_deferred()
+    if outcome["error"] is not None:
+        raise outcome["error"]
+    result = outcome["result"]
+    if cancelled.is_set() and result and result.get("cancelled"):
+        git_ui.info(PUSH_SUPERSEDED_MESSAGE)
+    return result
+
+
 def export_fusion_design(
     design: adsk.fusion.Design,
     export_dir: str,
@@ -835,6 +1172,86 @@ def export_fusion_design(
     return exported
 
 
+class CustomEventDispatcher(adsk.core.CustomEventHandler):
+    """Route a custom event to the callback currently installed for it."""
+
+    def __init__(self, event_id: str):
+        super().__init__()
+        self._event_id = event_id
+
+    def notify(self, args: adsk.core.CustomEventArgs):
+        callback = custom_event_callbacks.get(self._event_id)
+        if not callback:
+            return
+        try:
+            callback(args.additionalInfo)
+        except Exception:
+            if logger:
+                logger.exception("Custom event '%s' handler failed", self._event_id)
+
+
+def register_custom_events() -> None:
+    for event_id in CUSTOM_EVENT_IDS:
+        if event_id in registered_custom_events:
+            continue
+        try:
+            custom_event = app.registerCustomEvent(event_id)
+            dispatcher = CustomEventDispatcher(event_id)
+            custom_event.add(dispatcher)
+            handlers.append(dispatcher)
+            registered_custom_events.append(event_id)
+        except Exception:
+            # Callers fall back to doing the work synchronously.
+            if logger:
+                logger.warning("Could not register custom event '%s'", event_id, exc_info=True)
+
+
+def unregister_custom_events() -> None:
+    for event_id in registered_custom_events:
+        try:
+            app.unregisterCustomEvent(event_id)
+        except Exception:
+            if logger:
+                logger.debug("Failed to unregister custom event '%s'", event_id, exc_info=True)
+    registered_custom_events.clear()
+    custom_event_callbacks.clear()
+
+
+# addTableCommandInput's signature differs across Fusion API versions: the
+# 4-arg form (with column ratio) first, then the 3-arg form. The first dialog
+# records whichever form this Fusion accepts so later dialogs skip the probe.
+_TABLE_INPUT_SIGNATURES = (("1:1",), ())
+_table_input_signature: Optional[tuple] = None
+
+
+def add_format_settings_table(parent_inputs):
+    """Add the format settings table, or return None if Fusion rejects it.
+
+    Without the table the dialog still works; format defaults apply.
+    """
+    global _table_input_signature
+    signatures = _TABLE_INPUT_SIGNATURES
+    if _table_input_signature is not None:
+        signatures = (_table_input_signature,)
+    last_error = None
+    for extra_args in signatures:
+        try:
+            table = parent_inputs.addTableCommandInput(
+                "formatSettingsTable", "Format Settings", 2, *extra_args
+            )
+        except Exception as exc:
+            last_error = exc
+            continue
+        _table_input_signature = extra_args
+        return table
+    if logger:
+        logger.warning(
+            "Could not create format settings table; using default format settings.",
+            exc_info=last_error,
+        )
+    return None
+
+
 # -----------------------------
 # UI: CommandCreated
 # -----------------------------
@@ -973,21 +1390,13 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
             export_group.isExpanded = not has_saved_repo
             export_inputs = export_group.children
 
-            available_formats = [
-                "f3d",
-                "step",
-                "iges",
-                "sat",
-                "stl",
-            ]
-            default_formats_list = ["f3d", "step", "stl"]
             exportFormatsDropdown = export_inputs.addDropDownCommandInput(
                 "exportFormatsConfig", "Export Formats",
                 adsk.core.DropDownStyles.CheckBoxDropDownStyle
             )
-            for fmt in available_formats:
+            for fmt in AVAILABLE_FORMATS:
                 exportFormatsDropdown.listItems.add(
-                    fmt, fmt in default_formats_list, ""
+                    fmt, fmt in DEFAULT_EXPORT_FORMATS, ""
                 )
 
             format_settings_state = {}
@@ -998,38 +1407,18 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
             # would collide with the next build's.
             format_settings_ui_state = {"inputs": [], "generation": 0}
             
-            # addTableCommandInput's signature differs across Fusion API
-            # versions: try the 4-arg form, then the 3-arg form, otherwise
-            # run without the settings table (defaults still apply).
-            format_settings_table = None
-            try:
-                format_settings_table = export_inputs.addTableCommandInput(
-                    "formatSettingsTable", "Format Settings", 2, "1:1"
-                )
-            except Exception:
-                try:
-                    format_settings_table = export_inputs.addTableCommandInput(
-                        "formatSettingsTable", "Format Settings", 2
-                    )
-                except Exception:
-                    if logger:
-                        logger.warning(
-                            "Could not create format settings table; using default format settings.",
-                            exc_info=True,
-                        )
-
+            format_settings_table = add_format_settings_table(export_inputs)
 
             if format_settings_table:
-                format_settings_table.maximumVisibleRows = len(available_formats) + 1
+                format_settings_table.maximumVisibleRows = len(AVAILABLE_FORMATS) + 1
                 format_settings_table.columnSpacing = 4
                 format_settings_table.rowSpacing = 2
 
             def get_selected_formats():
-                return [
-                    item.name
-                    for item in exportFormatsDropdown.listItems
-                    if item.isSelected
-                ]
+                # Each access on the listItems collection is a round-trip
+                # into Fusion; enumerate it once and filter locally.
+                items = list(exportFormatsDropdown.listItems)
+                return [item.name for item in items if item.isSelected]
 
             def ensure_format_defaults(fmt: str):
                 defaults = FORMAT_SETTINGS_DEFAULT.get(fmt, {})
@@ -1084,7 +1473,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                     options = FORMAT_SETTINGS_OPTIONS.get(fmt, [])
                     dropdown.listItems.clear()
                     current_state = format_settings_state.get(fmt, {})
-                    state_key = list(FORMAT_SETTINGS_DEFAULT.get(fmt, {}).keys() or ["value"])[0]
+                    state_key = FORMAT_STATE_KEY.get(fmt, "value")
                     current_value = current_state.get(
                         state_key,
                         FORMAT_SETTINGS_DEFAULT.get(fmt, {}).get(state_key, "default")
@@ -1103,6 +1492,8 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
 
             def collect_format_settings_from_ui():
                 result = {}
+                if format_settings_table is None:
+                    return result
                 for fmt, data in format_setting_inputs.items():
                     dropdown, state_key, options = data
                     selected_item = dropdown.selectedItem
@@ -1213,7 +1604,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                 "Log Level",
                 adsk.core.DropDownStyles.TextListDropDownStyle,
             )
-            for level_name in ["ERROR", "WARNING", "INFO", "DEBUG"]:
+            for level_name in LOG_LEVELS:
                 logLevelDropdown.listItems.add(level_name, level_name == current_log_level_name, "")
 
             open_log_button = log_inputs.addBoolValueInput(
@@ -1235,7 +1626,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         is_saved
                         or (
                             not saved_formats
-                            and item.name in default_formats_list
+                            and item.name in DEFAULT_EXPORT_FORMATS
                         )
                     )
 
@@ -1281,6 +1672,8 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                 apply_repo_settings(sel_item.name)
 
             auto_path_state = {"auto": True}
+            # Last gitUrl value the conversion hints were built for.
+            url_hint_state = {"url": None}
 
             def convert_github_url(url: str) -> str:
                 return _convert_github_url(url)
@@ -1395,24 +1788,108 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         local_ui_ref.messageBox("Personal Access Token saved.", CMD_NAME)
                         use_pat_input.value = True
 
+            # Ids of inputs a handler branch is currently writing back to.
+            # Such a write fires inputChanged again for the same input; the
+            # echo is dropped instead of re-running (and re-writing) the branch.
+            reentry_guard = set()
+
+            def write_back(target_input, value):
+                reentry_guard.add(target_input.id)
+                try:
+                    target_input.value = value
+                finally:
+                    reentry_guard.discard(target_input.id)
+
             class InputChangedHandler(adsk.core.InputChangedEventHandler):
                 def __init__(self, repoSelector):
                     super().__init__()
                     self._repoSelector = repoSelector
+                    # Debounce state: ids waiting for their input to settle
+                    # (insertion-ordered), when the latest of them changed,
+                    # and the running settle timer, if any.
+                    self._pending_ids = {}
+                    self._last_change = 0.0
+                    self._timer = None
+
                 def notify(self, ic_args: adsk.core.InputChangedEventArgs):
                     # Exceptions escaping an event handler crash the dialog
                     # silently, so keep them contained and logged.
                     try:
-                        self._handle(ic_args)
+                        changed_input = ic_args.input
+                        if not changed_input:
+                            return
+                        # Drop write_back echoes here: the guard is empty
+                        # again by the time a deferred change is handled.
+                        if changed_input.id in reentry_guard:
+                            return
+                        if (
+                            changed_input.id in DEBOUNCED_INPUT_IDS
+                            and INPUT_SETTLED_EVENT_ID in registered_custom_events
+                        ):
+                            self._defer(changed_input.id)
+                        else:
+                            self._handle(changed_input)
                     except Exception:
                         if logger:
                             logger.exception("InputChangedHandler failed")
 
-                def _handle(self, ic_args: adsk.core.InputChangedEventArgs):
-                    if not ic_args.input:
+                def _defer(self, input_id: str):
+                    self._pending_ids[input_id] = None
+                    self._last_change = time.monotonic()
+                    if self._timer is None:
+                        self._start_timer(INPUT_DEBOUNCE_SECONDS)
+
+                def _start_timer(self, delay: float):
+                    # The timer thread only fires the custom event; the
+                    # handlers themselves run on the UI thread in flush().
+                    self._timer = threading.Timer(
+                        delay,
+                        local_app_ref.fireCustomEvent,
+                        (INPUT_SETTLED_EVENT_ID, ""),
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+
+                def flush_pending(self, _additional_info: str = ""):
+                    self._timer = None
+                    remaining = INPUT_DEBOUNCE_SECONDS - (time.monotonic() - self._last_change)
+                    if remaining > 0:
+                        # More keystrokes arrived while the timer ran.
+                        self._start_timer(remaining)
                         return
+                    self._run_pending()
+
+                def drain_pending(self):
+                    # Handle deferred changes right away, for callers that
+                    # depend on their effects (e.g. auto_path_state).
+                    if self._timer is not None:
+                        self._timer.cancel()
+                        self._timer = None
+                    self._run_pending()
+
+                def _run_pending(self):
+                    pending_ids = list(self._pending_ids)
+                    self._pending_ids.clear()
+                    for input_id in pending_ids:
+                        changed_input = inputs.itemById(input_id)
+                        if not changed_input:
+                            continue
+                        try:
+                            self._handle(changed_input)
+                        except Exception:
+                            if logger:
+                                logger.exception("InputChangedHandler failed")
+
+                def cancel_pending(self):
+                    if self._timer is not None:
+                        self._timer.cancel()
+                        self._timer = None
+                    self._pending_ids.clear()
 
-                    input_id = ic_args.input.id
+                def _handle(self, changed_input):
+                    input_id = changed_input.id
+                    if input_id in reentry_guard:
+                        return
                     if input_id == "repoSelector":
                         sel = self._repoSelector.selectedItem
                         if sel:
@@ -1439,6 +1916,11 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         status_input = inputs.itemById("conversionStatus")
                         if git_url_input and status_input:
                             current_url = git_url_input.value.strip()
+                            if current_url == url_hint_state["url"]:
+                                # Only whitespace changed; the hints still apply.
+                                update_validation()
+                                return
+                            url_hint_state["url"] = current_url
                             hints = []
                             if current_url:
                                 converted = convert_github_url(current_url)
@@ -1451,7 +1933,10 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                             status_input.text = "\n".join(hints)
                         update_validation()
                     elif input_id == "exportFormatsConfig":
-                        sync_format_settings_rows()
+                        # Without the settings table there are no rows to
+                        # rebuild (and no formatSetting_* inputs below).
+                        if format_settings_table is not None:
+                            sync_format_settings_rows()
                     elif input_id == "branchPreview":
                         preview_input = inputs.itemById("branchPreview")
                         # Blank means "no override" — never sanitize an empty
@@ -1461,14 +1946,14 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         if preview_input and preview_input.value.strip():
                             sanitized = sanitize_branch_name(preview_input.value)
                             if sanitized != preview_input.value:
-                                preview_input.value = sanitized
+                                write_back(preview_input, sanitized)
                     elif input_id == "exportSubfolder":
                         export_input = inputs.itemById("exportSubfolder")
                         if export_input:
                             normalized_value = update_export_subfolder_feedback(export_input.value)
                             if normalized_value != export_input.value:
-                                export_input.value = normalized_value
-                    elif input_id.startswith("formatSetting_"):
+                                write_back(export_input, normalized_value)
+                    elif format_settings_table is not None and input_id.startswith("formatSetting_"):
                         # Ids carry a per-rebuild generation suffix ("_g<n>").
                         fmt_key = re.sub(r"_g\d+$", "", input_id.split("_", 1)[1])
                         data = format_setting_inputs.get(fmt_key)
@@ -1482,7 +1967,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                                     selected.name,
                                 )
                     elif input_id == "browseRepoPath":
-                        ic_args.input.value = False
+                        write_back(changed_input, False)
                         folder_dialog = local_ui_ref.createFolderDialog()
                         folder_dialog.title = "Select Repository Folder"
                         if folder_dialog.showDialog() == adsk.core.DialogResults.DialogOK:
@@ -1494,10 +1979,10 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         if selected_item:
                             set_logger_level(selected_item.name)
                     elif input_id == "openLogFile":
-                        ic_args.input.value = False
+                        write_back(changed_input, False)
                         open_log_file(local_ui_ref)
                     elif input_id == "managePat":
-                        ic_args.input.value = False
+                        write_back(changed_input, False)
                         repo_name_for_pat = get_selected_repo_name()
                         if repo_name_for_pat == ADD_NEW_OPTION:
                             local_ui_ref.messageBox("Add the repository before managing credentials.", CMD_NAME)
@@ -1507,17 +1992,34 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                         repo_name_for_pat = get_selected_repo_name()
                         if repo_name_for_pat == ADD_NEW_OPTION:
                             local_ui_ref.messageBox("Add the repository before enabling stored PAT usage.", CMD_NAME)
-                            use_pat_input.value = False
-                        elif use_pat_input.value and not read_stored_pat(repo_name_for_pat):
+                            write_back(use_pat_input, False)
+                        elif use_pat_input.value and not read_stored_pat_cached(repo_name_for_pat):
                             local_ui_ref.messageBox(
                                 "No stored Personal Access Token was found. Use 'Manage Personal Access Token…' to add one first.",
                                 CMD_NAME,
                             )
-                            use_pat_input.value = False
+                            write_back(use_pat_input, False)
 
             on_input_changed = InputChangedHandler(repoSelectorInput)
             args.command.inputChanged.add(on_input_changed)
             dialog_handlers.append(on_input_changed)
+            custom_event_callbacks[INPUT_SETTLED_EVENT_ID] = on_input_changed.flush_pending
+
+            # A keystroke's settle timer can outlive the dialog (e.g. on
+            # Cancel); stop it so flush_pending never runs on dead inputs.
+            class DestroyHandler(adsk.core.CommandEventHandler):
+                def notify(self, destroy_args: adsk.core.CommandEventArgs):
+                    try:
+                        on_input_changed.cancel_pending()
+                        if custom_event_callbacks.get(INPUT_SETTLED_EVENT_ID) == on_input_changed.flush_pending:
+                            custom_event_callbacks.pop(INPUT_SETTLED_EVENT_ID)
+                    except Exception:
+                        if logger:
+                            logger.exception("DestroyHandler failed")
+
+            on_destroy = DestroyHandler()
+            args.command.destroy.add(on_destroy)
+            dialog_handlers.append(on_destroy)
 
             ensure_new_repo_defaults()
 
@@ -1532,6 +2034,10 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                     temp_dir = None
                     try:
                         logger.info("Execute handler starting")
+                        # Keystrokes still inside the debounce window must
+                        # take effect first: e.g. a typed repoPath clears
+                        # auto_path_state, which the new-repo branch reads.
+                        on_input_changed.drain_pending()
                         cmd_inputs = execute_args.command.commandInputs
                         selected_action_item = cmd_inputs.itemById("repoSelector").selectedItem
                         if not selected_action_item:
@@ -1587,8 +2093,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
 
                         # Formats
                         logger.info("Getting export formats and settings")
-                        export_formats_input = cmd_inputs.itemById("exportFormatsConfig")
-                        selected_formats = [item.name for item in export_formats_input.listItems if item.isSelected]
+                        selected_formats = get_selected_formats()
                         export_formats_val = selected_formats if selected_formats else ["f3d"]
                         current_format_settings = collect_format_settings_from_ui()
                         current_format_settings = {
@@ -1766,10 +2271,7 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                             use_pat_input_cmd = cmd_inputs.itemById("useStoredPat")
                             use_pat_selected = bool(use_pat_input_cmd.value) if use_pat_input_cmd else False
 
-                        selected_log_item = logLevelDropdown.selectedItem or next(
-                            (item for item in logLevelDropdown.listItems if item.isSelected),
-                            None,
-                        )
+                        selected_log_item = logLevelDropdown.selectedItem
                         log_level_name = selected_log_item.name if selected_log_item else current_log_level_name
                         set_logger_level(log_level_name)
 
@@ -1788,11 +2290,21 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                             meta_section["globalLogLevel"] = log_level_name
 
                         current_config[selected_repo_name] = selected_repo_details
-                        save_config(current_config)
+                        save_config_if_changed(current_config)
+
+                        # Cheap filesystem check first: a missing .git aborts
+                        # before the credential read and design lookup.
+                        git_repo_path = os.path.expanduser(selected_repo_details["path"]).replace("/", os.sep)
+                        if not os.path.isdir(os.path.join(git_repo_path, ".git")):
+                            current_ui_ref.messageBox(
+                                f"Path '{git_repo_path}' for repo '{selected_repo_name}' is not a Git repo.", CMD_NAME
+                            )
+                            execute_args.executeFailed = True
+                            return
 
                         pat_credentials = None
                         if IS_WINDOWS and use_pat_selected:
-                            pat_credentials = read_stored_pat(selected_repo_name)
+                            pat_credentials = read_stored_pat_cached(selected_repo_name)
                             if not pat_credentials:
                                 current_ui_ref.messageBox(
                                     "No stored Personal Access Token was found. Use 'Manage Personal Access Token…' before enabling this option.",
@@ -1824,42 +2336,35 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                             execute_args.executeFailed = True
                             return
 
-                        git_repo_path = os.path.expanduser(selected_repo_details["path"]).replace("/", os.sep)
-                        if not os.path.isdir(os.path.join(git_repo_path, ".git")):
+                        # Resolve formats before the progress dialog and temp
+                        # directory exist, so bailing out needs no cleanup.
+                        formats_for_this_push = selected_repo_details.get("exportFormats", ["f3d"])
+                        saved_format_settings = selected_repo_details.get("formatSettings", {})
+                        valid_formats, detected_warnings = determine_valid_export_formats(
+                            design,
+                            formats_for_this_push,
+                        )
+                        if not valid_formats:
                             current_ui_ref.messageBox(
-                                f"Path '{git_repo_path}' for repo '{selected_repo_name}' is not a Git repo.", CMD_NAME
+                                "No valid export formats available for this design.",
+                                CMD_NAME,
                             )
                             execute_args.executeFailed = True
                             return
+                        format_settings_for_push = {
+                            fmt: saved_format_settings.get(fmt, {})
+                            for fmt in valid_formats
+                        }
 
-                        progress = current_ui_ref.createProgressDialog()
-                        progress.isBackgroundTranslucencyEnabled = True
-                        progress.cancelButtonText = ""
-                        progress.show("Fusion → GitHub", "Exporting design…", 0, 2, 0)
+                        progress_dialog = current_ui_ref.createProgressDialog()
+                        progress_dialog.isBackgroundTranslucencyEnabled = True
+                        progress_dialog.cancelButtonText = ""
+                        progress_dialog.show("Fusion → GitHub", "Exporting design…", 0, 2, 0)
+                        progress = ThrottledProgress(progress_dialog)
 
-                        export_warnings = []
+                        export_warnings = list(detected_warnings)
                         exported_display_names = []
                         with temporary_export_dir() as temp_dir:
-                            formats_for_this_push = selected_repo_details.get("exportFormats", ["f3d"])
-                            format_settings_for_push = selected_repo_details.get("formatSettings", {})
-                            valid_formats, detected_warnings = determine_valid_export_formats(
-                                design,
-                                formats_for_this_push,
-                            )
-                            export_warnings.extend(detected_warnings)
-                            if not valid_formats:
-                                progress.hide()
-                                current_ui_ref.messageBox(
-                                    "No valid export formats available for this design.",
-                                    CMD_NAME,
-                                )
-                                execute_args.executeFailed = True
-                                return
-
-                            format_settings_for_push = {
-                                fmt: format_settings_for_push.get(fmt, {})
-                                for fmt in valid_formats
-                            }
                             exported_files_paths = export_fusion_design(
                                 design,
                                 temp_dir,
@@ -1877,51 +2382,69 @@ class GitCommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
                                 execute_args.executeFailed = True
                                 return
 
-                            def materialize_exports():
-                                # Invoked by the git pipeline after the export
-                                # branch exists, so the stash/pull steps never
-                                # touch (or swallow) the exported files.
-                                destination_root = ensure_export_subfolder_exists(
-                                    git_repo_path, resolved_export_subfolder
-                                )
-                                final_paths = []
-                                for src in exported_files_paths:
-                                    dst = os.path.join(destination_root, os.path.basename(src))
-                                    shutil.copy2(src, dst)
-                                    if not os.path.exists(dst) or os.path.getsize(dst) == 0:
-                                        raise RuntimeError(f"Copied file missing/empty:\n{dst}")
-                                    final_paths.append(os.path.normpath(dst))
-                                    rel_display = os.path.relpath(dst, git_repo_path).replace("\\", "/")
-                                    exported_display_names.append(rel_display)
-                                    if logger:
-                                        logger.info(
-                                            "Copied -> %s (%d bytes)",
-                                            dst,
-                                            os.path.getsize(dst),
+                            def run_git_pipeline(git_ui, report_copied=None, cancelled=None):
+                                # May run on the push worker thread: only
+                                # file/git work here, every prompt goes
+                                # through git_ui. Bails out quietly once
+                                # *cancelled* (a newer push) is set.
+                                bailed = False
+
+                                def materialize_exports():
+                                    nonlocal bailed
+                                    # Invoked by the git pipeline after the export
+                                    # branch exists, so the stash/pull steps never
+                                    # touch (or swallow) the exported files.
+                                    destination_root = ensure_export_subfolder_exists(
+                                        git_repo_path, resolved_export_subfolder
+                                    )
+                                    try:
+                                        copied = copy_export_files(
+                                            exported_files_paths, destination_root, cancelled
                                         )
-                                return final_paths
+                                    except RuntimeError:
+                                        # Superseded mid-copy: nothing is committed.
+                                        bailed = cancelled is not None and cancelled.is_set()
+                                        raise
+                                    exported_display_names.extend(
+                                        os.path.relpath(dst, git_repo_path).replace("\\", "/")
+                                        for dst in copied
+                                    )
+                                    if report_copied:
+                                        report_copied()
+                                    return [os.path.normpath(dst) for dst in copied]
+
+                                if cancelled is not None and cancelled.is_set():
+                                    return {"cancelled": True}
+                                result = core_handle_git_operations(
+                                    git_repo_path,
+                                    [],
+                                    commit_msg_for_this_push,
+                                    branch_format_for_this_push,
+                                    git_ui,
+                                    base_name,
+                                    branch_override=branch_override_sanitized or None,
+                                    skip_pull=skip_pull_selected,
+                                    pat_credentials=pat_credentials,
+                                    logger=logger,
+                                    materialize_files=materialize_exports,
+                                )
+                                return {"cancelled": True} if bailed else result
 
                             if progress:
-                                progress.message = "Pushing to GitHub…"
-                                progress.progressValue = 1
+                                progress.set(1, "Pushing to GitHub…")
 
                             git_ui_adapter = FusionCommandGitUI(current_ui_ref)
-                            git_result = core_handle_git_operations(
-                                git_repo_path,
-                                [],
-                                commit_msg_for_this_push,
-                                branch_format_for_this_push,
-                                git_ui_adapter,
-                                base_name,
-                                branch_override=branch_override_sanitized or None,
-                                skip_pull=skip_pull_selected,
-                                pat_credentials=pat_credentials,
-                                logger=logger,
-                                materialize_files=materialize_exports,
-                            )
+                            if all(event_id in registered_custom_events for event_id in PUSH_EVENT_IDS):
+                                # exported_display_names is filled on the worker
+                                # and only read after it has finished.
+                                git_result = run_push_in_background(
+                                    run_git_pipeline, git_ui_adapter, progress
+                                )
+                            else:
+                                git_result = run_git_pipeline(git_ui_adapter)
 
                         if progress:
-                            progress.progressValue = 2
+                            progress.finish()
                             progress.hide()
 
                         if git_result and not git_result.get("cancelled"):
@@ -2060,6 +2583,7 @@ def run(context):
             logger.info(f"'{CMD_NAME}' run() called.")
         handlers.clear()
         dialog_handlers.clear()
+        register_custom_events()
 
         push_cmd_def = ui.commandDefinitions.itemById(CMD_ID)
         if not push_cmd_def:
@@ -2173,6 +2697,7 @@ def stop(context):
         if push_cmd_def and push_cmd_def.isValid:
             push_cmd_def.deleteMe()
 
+        unregister_custom_events()
         handlers.clear()
         dialog_handlers.clear()
 
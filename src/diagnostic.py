@@ -6,98 +6,146 @@ Run this to help diagnose why the add-in might be crashing silently.
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+HOME = os.path.expanduser("~")
 
 print("=" * 70)
 print("FusionToGitHub Add-In Diagnostic Tool")
 print("=" * 70)
 
-# 1. Check Python version
-print(f"\n1. Python Version: {sys.version}")
-print(f"   Python Executable: {sys.executable}")
+src_dir = os.path.dirname(os.path.abspath(__file__))
 
-# 2. Check if Git is available
-git_exe = shutil.which("git")
-if git_exe:
-    print(f"\n2. Git Found: {git_exe}")
-    import subprocess
-    try:
-        result = subprocess.run([git_exe, "--version"], capture_output=True, text=True)
-        print(f"   Version: {result.stdout.strip()}")
-    except Exception as e:
-        print(f"   Error running git: {e}")
-else:
-    print("\n2. Git NOT FOUND in PATH")
-
-# 3. Check log file
-log_path = os.path.expanduser("~/.PushToGitHub_AddIn_Data/PushToGitHub.log")
-print(f"\n3. Log File: {log_path}")
-if os.path.exists(log_path):
-    print(f"   File exists (size: {os.path.getsize(log_path)} bytes)")
-    print("\n   Last 20 lines of log:")
-    print("   " + "-" * 66)
-    try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+
+# Sections 2, 3, 6 and 7 are independent and mostly wait on a subprocess or
+# the disk, so they run concurrently; each returns its lines, which are
+# printed in section order.
+def check_git():
+    out = []
+    git_exe = shutil.which("git")
+    if git_exe:
+        out.append(f"\n2. Git Found: {git_exe}")
+        import subprocess
+        try:
+            result = subprocess.run([git_exe, "--version"], capture_output=True, text=True)
+            out.append(f"   Version: {result.stdout.strip()}")
+        except Exception as e:
+            out.append(f"   Error running git: {e}")
+    else:
+        out.append("\n2. Git NOT FOUND in PATH")
+    return out
+
+
+def check_log():
+    out = []
+    log_path = os.path.join(HOME, ".PushToGitHub_AddIn_Data", "PushToGitHub.log")
+    out.append(f"\n3. Log File: {log_path}")
+    if os.path.exists(log_path):
+        out.append(f"   File exists (size: {os.path.getsize(log_path)} bytes)")
+        out.append("\n   Last 20 lines of log:")
+        out.append("   " + "-" * 66)
+        try:
+            # Read only the end of the log; it can grow to many megabytes.
+            with open(log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                start = max(0, f.tell() - 65536)
+                f.seek(start)
+                lines = f.read().decode('utf-8', errors='replace').splitlines()
+            if start and lines:
+                lines = lines[1:]  # the first line is probably cut off
             for line in lines[-20:]:
-                print(f"   {line.rstrip()}")
+                out.append(f"   {line.rstrip()}")
+        except Exception as e:
+            out.append(f"   Error reading log: {e}")
+    else:
+        out.append("   Log file does not exist yet")
+    return out
+
+
+def check_syntax():
+    out = ["\n6. Checking for syntax errors:"]
+    main_file = os.path.join(src_dir, "Push_To_GitHub.py")
+    try:
+        with open(main_file, 'r', encoding='utf-8') as f:
+            code = f.read()
+        compile(code, main_file, 'exec')
+        out.append("   ✓ No syntax errors in Push_To_GitHub.py")
+    except SyntaxError as e:
+        out.append(f"   ✗ Syntax Error: {e}")
+        out.append(f"      Line {e.lineno}: {e.text}")
     except Exception as e:
-        print(f"   Error reading log: {e}")
-else:
-    print("   Log file does not exist yet")
+        out.append(f"   ✗ Error: {e}")
+    return out
 
-# 4. Check if source files exist
-src_dir = os.path.dirname(os.path.abspath(__file__))
-print(f"\n4. Source Directory: {src_dir}")
-files_to_check = [
-    "Push_To_GitHub.py",
-    "Push_To_GitHub.manifest",
-    "fusion_git_core.py",
-    "push_cli.py"
-]
-for filename in files_to_check:
-    filepath = os.path.join(src_dir, filename)
-    if os.path.exists(filepath):
-        print(f"   ✓ {filename} (size: {os.path.getsize(filepath)} bytes)")
+
+def check_config():
+    out = []
+    config_path = os.path.join(HOME, ".fusion_git_repos.json")
+    out.append(f"\n7. Config File: {config_path}")
+    if os.path.exists(config_path):
+        out.append(f"   File exists (size: {os.path.getsize(config_path)} bytes)")
+        try:
+            import json
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            out.append(
+                f"   ✓ Valid JSON (repositories configured: {len([k for k in config.keys() if k != '__meta__'])})"
+            )
+        except Exception as e:
+            out.append(f"   ✗ Invalid JSON: {e}")
     else:
-        print(f"   ✗ {filename} MISSING")
-
-# 5. Try importing the core module
-print("\n5. Testing imports:")
-try:
-    sys.path.insert(0, src_dir)
-    import fusion_git_core
-    print(f"   ✓ fusion_git_core imported successfully (Version: {fusion_git_core.VERSION})")
-except Exception as e:
-    print(f"   ✗ Failed to import fusion_git_core: {e}")
-
-# 6. Check for syntax errors in main file
-print("\n6. Checking for syntax errors:")
-main_file = os.path.join(src_dir, "Push_To_GitHub.py")
-try:
-    with open(main_file, 'r', encoding='utf-8') as f:
-        code = f.read()
-    compile(code, main_file, 'exec')
-    print("   ✓ No syntax errors in Push_To_GitHub.py")
-except SyntaxError as e:
-    print(f"   ✗ Syntax Error: {e}")
-    print(f"      Line {e.lineno}: {e.text}")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# 7. Check config file
-config_path = os.path.expanduser("~/.fusion_git_repos.json")
-print(f"\n7. Config File: {config_path}")
-if os.path.exists(config_path):
-    print(f"   File exists (size: {os.path.getsize(config_path)} bytes)")
+        out.append("   Config file does not exist (will be created on first use)")
+    return out
+
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    git_check = executor.submit(check_git)
+    log_check = executor.submit(check_log)
+    syntax_check = executor.submit(check_syntax)
+    config_check = executor.submit(check_config)
+
+    # 1. Check Python version
+    print(f"\n1. Python Version: {sys.version}")
+    print(f"   Python Executable: {sys.executable}")
+
+    # 2. Check if Git is available
+    print("\n".join(git_check.result()))
+
+    # 3. Check log file
+    print("\n".join(log_check.result()))
+
+    # 4. Check if source files exist
+    print(f"\n4. Source Directory: {src_dir}")
+    files_to_check = [
+        "Push_To_GitHub.py",
+        "Push_To_GitHub.manifest",
+        "fusion_git_core.py",
+        "push_cli.py"
+    ]
+    # One directory listing instead of an exists + getsize pair per file.
+    with os.scandir(src_dir) as it:
+        entries = {entry.name: entry for entry in it}
+    for filename in files_to_check:
+        entry = entries.get(filename)
+        if entry is not None:
+            print(f"   ✓ {filename} (size: {entry.stat().st_size} bytes)")
+        else:
+            print(f"   ✗ {filename} MISSING")
+
+    # 5. Try importing the core module
+    print("\n5. Testing imports:")
     try:
-        import json
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        print(f"   ✓ Valid JSON (repositories configured: {len([k for k in config.keys() if k != '__meta__'])})")
+        sys.path.insert(0, src_dir)
+        import fusion_git_core
+        print(f"   ✓ fusion_git_core imported successfully (Version: {fusion_git_core.VERSION})")
     except Exception as e:
-        print(f"   ✗ Invalid JSON: {e}")
-else:
-    print("   Config file does not exist (will be created on first use)")
+        print(f"   ✗ Failed to import fusion_git_core: {e}")
+
+    # 6. Check for syntax errors in main file
+    print("\n".join(syntax_check.result()))
+
+    # 7. Check config file
+    print("\n".join(config_check.result()))
 
 print("\n" + "=" * 70)
 print("Diagnostic Complete!")
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
@@ -18,8 +20,15 @@ from typing import Optional
 _GITHUB_WEB_URL_RE = re.compile(
     r"^(?:https://)?(?:www\.)?github\.com/([^/?#]+)/([^/?#]+?)(?:\.git)?(?:[/?#].*)?$"
 )
+# Home directory, resolved once for the "~/..." paths typed into the dialog.
+_HOME = os.path.expanduser("~")
+# Clone URLs accepted when adding a new repository.
+_GIT_URL_RE = re.compile(r"^(https://|git@|ssh://).+\.git$")
+# Characters that are invalid in a Windows path segment.
+_INVALID_SEGMENT_CHARS_RE = re.compile(r'[<>:"\\|?*]')
 
 
+@lru_cache(maxsize=256)
 def convert_github_url(url: str) -> str:
     """Convert a GitHub browser URL to the canonical Git clone URL.
 
@@ -59,6 +68,13 @@ def derive_repo_name_from_url(url: str) -> str:
     return candidate
 
 
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 def validate_repo_inputs(
     selection_name: str,
     raw_path: str,
@@ -78,15 +94,18 @@ def validate_repo_inputs(
         messages[field] = (text, severity)
 
     expanded = raw_path.strip()
-    if expanded:
+    if expanded == "~" or expanded.startswith(("~/", "~" + os.sep)):
+        expanded = _HOME + expanded[1:]
+    elif expanded.startswith("~"):  # ~otheruser/...
         expanded = os.path.expanduser(expanded)
     normalized_path = os.path.abspath(expanded) if expanded else ""
 
-    git_dir_exists = (
-        os.path.isdir(os.path.join(normalized_path, ".git"))
-        if normalized_path
-        else False
-    )
+    # This runs on every keystroke: stat each path once and derive the
+    # exists/is-directory checks from the results.
+    path_stat = _stat_or_none(normalized_path) if normalized_path else None
+    path_is_dir = path_stat is not None and stat.S_ISDIR(path_stat.st_mode)
+    git_stat = _stat_or_none(os.path.join(normalized_path, ".git")) if path_is_dir else None
+    git_dir_exists = git_stat is not None and stat.S_ISDIR(git_stat.st_mode)
     has_git_url = bool(git_url_val.strip())
 
     if not normalized_path:
@@ -95,7 +114,7 @@ def validate_repo_inputs(
     elif not os.path.isabs(normalized_path):
         set_msg("path", "⚠️ Path must be absolute.", "error")
         ok = False
-    elif not os.path.exists(normalized_path):
+    elif path_stat is None:
         if selection_name == add_new_option and has_git_url:
             set_msg(
                 "path",
@@ -105,7 +124,7 @@ def validate_repo_inputs(
         else:
             set_msg("path", "❌ Path does not exist.", "error")
             ok = False
-    elif not os.path.isdir(normalized_path):
+    elif not path_is_dir:
         set_msg("path", "❌ Path is not a directory.", "error")
         ok = False
     else:
@@ -127,8 +146,7 @@ def validate_repo_inputs(
 
     if selection_name == add_new_option:
         if has_git_url:
-            pattern = r"^(https://|git@|ssh://).+\.git$"
-            if re.match(pattern, git_url_val.strip()):
+            if _GIT_URL_RE.match(git_url_val.strip()):
                 set_msg("git", "✅ Git URL format looks valid.", "success")
             else:
                 set_msg(
@@ -185,7 +203,7 @@ def normalize_export_subfolder(raw: str) -> str:
     for segment in parts:
         if segment in invalid:
             raise ValueError("Export subfolder cannot contain '..' or '.' segments.")
-        if re.search(r'[<>:"\\|?*]', segment):
+        if _INVALID_SEGMENT_CHARS_RE.search(segment):
             raise ValueError(f"Invalid characters in subfolder segment '{segment}'.")
     return "/".join(parts)
 
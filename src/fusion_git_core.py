@@ -2,19 +2,51 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Protocol, Sequence
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Sequence
 
 VERSION = "V7.7"
 IS_WINDOWS = os.name == "nt"
-GIT_EXE = shutil.which("git") or (r"C:\Program Files\Git\bin\git.exe" if IS_WINDOWS else "git")
+_DEFAULT_GIT_EXE = r"C:\Program Files\Git\bin\git.exe" if IS_WINDOWS else "git"
+_git_exe_cache: Optional[str] = None
+_git_available_cache = False
+_BRANCH_SANITIZE_RE = re.compile(r"[^\w\-\./_]+")
+# Names sanitize_branch_name would leave untouched: only allowed characters,
+# and no leading/trailing '.' or '/' for the strip steps to remove.
+_CLEAN_BRANCH_RE = re.compile(r"[\w\-](?:[\w\-\./]*[\w\-])?")
+_TEMPLATE_FIELD_RE = re.compile(r"\{(filename|branch|timestamp)\}")
+
+
+def _get_git_exe() -> str:
+    # Resolved on first use so importing the module never searches PATH.
+    global _git_exe_cache
+    if _git_exe_cache is None:
+        found = shutil.which("git")
+        if not found:
+            if not os.path.isfile(_DEFAULT_GIT_EXE):
+                # Not cached: Git may be installed while Fusion keeps running.
+                return _DEFAULT_GIT_EXE
+            # Fusion's PATH often lacks Git even though it is installed.
+            found = _DEFAULT_GIT_EXE
+        _git_exe_cache = found
+    return _git_exe_cache
+
+
+def __getattr__(name: str):
+    # GIT_EXE stays importable while being resolved lazily. It is not in
+    # __all__: a star import would resolve it eagerly anyway.
+    if name == "GIT_EXE":
+        return _get_git_exe()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class GitUI(Protocol):
@@ -29,7 +61,9 @@ class GitUI(Protocol):
 
 def sanitize_branch_name(raw: Optional[str]) -> str:
     candidate = (raw or "").strip()
-    candidate = re.sub(r"[^\w\-\./_]+", "_", candidate)
+    if _CLEAN_BRANCH_RE.fullmatch(candidate):
+        return candidate[:200]
+    candidate = _BRANCH_SANITIZE_RE.sub("_", candidate)
     candidate = candidate.strip(" .")
     candidate = candidate.lstrip("/")
     candidate = candidate.rstrip("/")
@@ -40,27 +74,57 @@ def sanitize_branch_name(raw: Optional[str]) -> str:
     return candidate
 
 
+def _fill_template(template: str, values: Dict[str, str]) -> str:
+    # One pass over the template. Unlike str.format_map, any other braces
+    # (unknown fields, stray '{') are left exactly as the user typed them,
+    # and substituted values are never re-scanned for placeholders.
+    return _TEMPLATE_FIELD_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
 def generate_branch_name(template: str, design_basename: str, timestamp: Optional[str] = None):
     ts = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
     branch_template = template or "fusion-export/{filename}-{timestamp}"
-    populated = branch_template.replace("{filename}", design_basename).replace("{timestamp}", ts)
+    populated = _fill_template(branch_template, {"filename": design_basename, "timestamp": ts})
     return sanitize_branch_name(populated), ts
 
 
-def git_run(repo_path: str, *args: str, check: bool = True, env: Optional[Dict[str, str]] = None):
-    creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if IS_WINDOWS else 0
-    env_vars = os.environ.copy()
+class _GitEnv(dict):
+    """A complete git subprocess environment that git_run uses as-is."""
+
+
+def _build_git_env(overrides: Optional[Dict[str, str]] = None) -> _GitEnv:
+    env_vars = _GitEnv(os.environ)
     # Force the C locale so git's messages are always English: the pipeline
     # matches on message text (e.g. "couldn't find remote ref"), which a
     # localized git would translate.
     env_vars["LC_ALL"] = "C"
     env_vars["LANG"] = "C"
-    if env:
-        env_vars.update(env)
+    if overrides:
+        env_vars.update(overrides)
+    return env_vars
+
+
+def git_run(
+    repo_path: str,
+    *args: str,
+    check: bool = True,
+    env: Optional[Dict[str, str]] = None,
+    capture: bool = True,
+):
+    """Run git in *repo_path*.
+
+    With ``capture=False`` stdout is discarded (``proc.stdout`` is ``None``);
+    stderr is still captured for the error message. Only use it for
+    commands that report their failures on stderr.
+    """
+    creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if IS_WINDOWS else 0
+    # A prebuilt environment is reused; anything else is merged over a copy.
+    env_vars = env if isinstance(env, _GitEnv) else _build_git_env(env)
     proc = subprocess.run(
-        [GIT_EXE, *args],
+        [_get_git_exe(), *args],
         cwd=repo_path,
-        capture_output=True,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         creationflags=creation_flags,
         env=env_vars,
@@ -71,36 +135,37 @@ def git_run(repo_path: str, *args: str, check: bool = True, env: Optional[Dict[s
 
 
 def git_output(repo_path: str, *args: str, env: Optional[Dict[str, str]] = None) -> str:
-    return (git_run(repo_path, *args, check=True, env=env).stdout or "").strip()
+    return (git_run(repo_path, *args, check=True, env=env, capture=True).stdout or "").strip()
 
 
 def git_available() -> bool:
+    # Only success is cached, so installing Git mid-session is picked up.
+    global _git_available_cache
+    if _git_available_cache:
+        return True
     try:
         creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if IS_WINDOWS else 0
         subprocess.run(
-            [GIT_EXE, "--version"],
+            [_get_git_exe(), "--version"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=True,
             creationflags=creation_flags,
         )
-        return True
     except Exception:
         return False
+    _git_available_cache = True
+    return True
 
 
-@contextmanager
-def git_askpass_env(username: str, token: str):
-    """Yield env vars that let git authenticate through a temp askpass script.
+def _reset_git_available_cache() -> None:
+    """Forget the cached Git lookups (for tests)."""
+    global _git_exe_cache, _git_available_cache
+    _git_exe_cache = None
+    _git_available_cache = False
 
-    The script itself contains no credentials: it echoes environment
-    variables that exist only in the git subprocess environment, so the
-    token is never written to disk (and needs no shell escaping).
-    """
-    if not token:
-        yield {}
-        return
 
+def _write_askpass_script() -> str:
     temp_dir = tempfile.mkdtemp(prefix="fusion_git_auth_")
     script_path = os.path.join(
         temp_dir,
@@ -143,22 +208,119 @@ def git_askpass_env(username: str, token: str):
         askpass_file.write(script_contents)
     if not IS_WINDOWS:
         os.chmod(script_path, 0o700)
+    return script_path
+
+
+_askpass_lock = threading.Lock()
+_askpass_script_path: Optional[str] = None
+
+
+def _askpass_script() -> str:
+    # The script holds no credentials, so one copy serves every push in the
+    # process; it is recreated only if something deleted it meanwhile.
+    global _askpass_script_path
+    with _askpass_lock:
+        if _askpass_script_path and os.path.exists(_askpass_script_path):
+            return _askpass_script_path
+        if _askpass_script_path:
+            shutil.rmtree(os.path.dirname(_askpass_script_path), ignore_errors=True)
+        _askpass_script_path = _write_askpass_script()
+        return _askpass_script_path
+
+
+def _cleanup_askpass_script() -> None:
+    """Remove the shared askpass script (registered with atexit)."""
+    global _askpass_script_path
+    with _askpass_lock:
+        if _askpass_script_path:
+            shutil.rmtree(os.path.dirname(_askpass_script_path), ignore_errors=True)
+        _askpass_script_path = None
+
+
+atexit.register(_cleanup_askpass_script)
+
+
+@contextmanager
+def git_askpass_env(username: str, token: str):
+    """Yield env vars that let git authenticate through a temp askpass script.
+
+    The script itself contains no credentials: it echoes environment
+    variables that exist only in the git subprocess environment, so the
+    token is never written to disk (and needs no shell escaping). That also
+    makes the script reusable: it is created once per process and removed
+    at exit.
+    """
+    if not token:
+        yield {}
+        return
 
-    env_map = {
-        "GIT_ASKPASS": script_path,
+    yield {
+        "GIT_ASKPASS": _askpass_script(),
         "GIT_TERMINAL_PROMPT": "0",
         "FUSION_GIT_ASKPASS_USERNAME": username or "",
         "FUSION_GIT_ASKPASS_TOKEN": token,
     }
 
+
+def _prepend_changelog_entry(changelog_path: str, header: str, entry_lines: Iterable[str]) -> None:
+    """Write *header* and the new entry ahead of the existing changelog entries.
+
+    The old entries are streamed into a sibling temp file, which then
+    atomically replaces the changelog, so memory use stays bounded however
+    long the history grows and a crash never leaves a half-written file.
+    *entry_lines* (without line endings) are written as they are produced.
+
+    Everything is handled as bytes: the existing entries are copied without
+    being decoded, and only the new text is encoded. It uses the line
+    endings of the existing header (the file may have been checked out with
+    CRLF or LF), or the platform's for a new file or one without a header.
+    """
+    known_headers = (
+        (header.encode("utf-8"), b"\n"),
+        (header.replace("\n", "\r\n").encode("utf-8"), b"\r\n"),
+    )
     try:
-        yield env_map
-    finally:
+        fr = open(changelog_path, "rb")
+    except FileNotFoundError:
+        fr = None
+    try:
+        newline = os.linesep.encode("ascii")
+        if fr is not None:
+            head = fr.read(max(len(known) for known, _ in known_headers))
+            skip = 0
+            for known, known_newline in known_headers:
+                if head.startswith(known):
+                    skip, newline = len(known), known_newline
+                    break
+            fr.seek(skip)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".CHANGELOG.",
+            suffix=".tmp",
+            dir=os.path.dirname(changelog_path),
+        )
         try:
-            os.remove(script_path)
-        except Exception:
-            pass
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            with os.fdopen(fd, "wb", buffering=1 << 16) as fw:
+                fw.write(header.encode("utf-8").replace(b"\n", newline))
+                for line in entry_lines:
+                    fw.write(line.encode("utf-8").replace(b"\n", newline))
+                    fw.write(newline)
+                if fr is not None:
+                    shutil.copyfileobj(fr, fw, 1 << 16)
+            if fr is not None:
+                fr.close()
+                shutil.copymode(changelog_path, tmp_path)
+            else:
+                os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, changelog_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    finally:
+        if fr is not None:
+            fr.close()
 
 
 def handle_git_operations(
@@ -193,75 +355,95 @@ def handle_git_operations(
     branch_name_final: Optional[str] = None
     timestamp_str: Optional[str] = None
     pull_failure_details: Optional[str] = None
+    # Set once the export branch is checked out; until then the repository
+    # is still on original_branch and there is nothing to restore.
+    switched_branch = False
 
     def _perform(git_env: Optional[Dict[str, str]]):
-        nonlocal original_branch, stashed, used_force_push, branch_name_final, timestamp_str, pull_failure_details, skip_pull  # noqa: E501
-
-        remotes = git_output(repo_path, "remote", env=git_env).splitlines()
-        if "origin" not in remotes:
-            ui.error("No 'origin' remote found in this repo.")
-            if logger:
-                logger.error("No 'origin' remote in %s", repo_path)
-            return {"failed": True}
+        nonlocal original_branch, stashed, used_force_push, branch_name_final, timestamp_str, pull_failure_details, skip_pull, switched_branch  # noqa: E501
+
+        # One clock reading names the branch and stamps the changelog entry,
+        # so the two always agree.
+        started_at = datetime.now()
+
+        # One porcelain v2 status reports the branch, its upstream, whether
+        # HEAD is unborn, and the dirty state, saving a process spawn each.
+        branch_head = branch_upstream = None
+        unborn = dirty = False
+        for line in git_output(repo_path, "status", "--porcelain=v2", "--branch", env=git_env).splitlines():
+            if line.startswith("# branch.head "):
+                branch_head = line[len("# branch.head ") :]
+            elif line.startswith("# branch.upstream "):
+                branch_upstream = line[len("# branch.upstream ") :]
+            elif line.startswith("# branch.oid "):
+                unborn = line[len("# branch.oid ") :] == "(initial)"
+            elif line and not line.startswith("#"):
+                dirty = True
+
+        # An upstream on origin proves the remote exists; otherwise ask git.
+        if not (branch_upstream or "").startswith("origin/"):
+            remotes = git_output(repo_path, "remote", env=git_env).splitlines()
+            if "origin" not in remotes:
+                ui.error("No 'origin' remote found in this repo.")
+                if logger:
+                    logger.error("No 'origin' remote in %s", repo_path)
+                return {"failed": True}
 
-        head_proc = git_run(repo_path, "symbolic-ref", "--short", "-q", "HEAD", check=False, env=git_env)
-        detached = head_proc.returncode != 0
+        detached = branch_head in (None, "(detached)")
         if not detached:
-            original_branch = (head_proc.stdout or "").strip()
+            original_branch = branch_head
 
         # A repository with no commits yet (fresh init/clone of an empty
         # remote) has an unborn HEAD: nothing is tracked, so there is
         # nothing to stash, and several git commands behave differently.
-        unborn = (
-            git_run(repo_path, "rev-parse", "--verify", "-q", "HEAD", check=False, env=git_env).returncode != 0
-        )
-
         # Stash before any branch switching: leaving a detached HEAD (below)
         # with a dirty working tree would otherwise fail or lose changes.
         if unborn:
             if logger:
                 logger.info("Repository has no commits yet; skipping the auto-stash step.")
-        else:
-            status = git_output(repo_path, "status", "--porcelain", env=git_env)
-            if status.strip():
-                if not ui.confirm(
-                    "Local changes detected. We'll stash them temporarily before pushing.\n"
-                    "Continue and auto-stash these changes?"
-                ):
-                    if logger:
-                        logger.info("User cancelled due to dirty working tree.")
-                    return {"cancelled": True}
-                git_run(repo_path, "stash", "push", "-u", "-m", our_stash_msg, env=git_env)
-                stashed = True
+        elif dirty:
+            if not ui.confirm(
+                "Local changes detected. We'll stash them temporarily before pushing.\n"
+                "Continue and auto-stash these changes?"
+            ):
                 if logger:
-                    logger.info("Stashed local changes.")
+                    logger.info("User cancelled due to dirty working tree.")
+                return {"cancelled": True}
+            git_run(repo_path, "stash", "push", "-u", "-m", our_stash_msg, env=git_env, capture=False)
+            stashed = True
+            if logger:
+                logger.info("Stashed local changes.")
 
         if detached:
-            try:
-                ref = git_output(
+            # One for-each-ref answers both questions: where origin/HEAD
+            # points, and whether a local main/master exists as a fallback.
+            refs = dict(
+                (line.split(" ", 1) + [""])[:2]
+                for line in git_output(
                     repo_path,
-                    "symbolic-ref",
+                    "for-each-ref",
+                    "--format=%(refname) %(symref)",
                     "refs/remotes/origin/HEAD",
-                    "--short",
+                    "refs/heads/main",
+                    "refs/heads/master",
                     env=git_env,
-                )
-                default_branch = ref.split("/")[-1]
-            except Exception:
-                branches = {
-                    b.strip().lstrip("* ").strip() for b in git_output(repo_path, "branch", env=git_env).splitlines()
-                }
-                if "main" in branches:
-                    default_branch = "main"
-                elif "master" in branches:
-                    default_branch = "master"
-                else:
-                    default_branch = None
+                ).splitlines()
+            )
+            origin_head = refs.get("refs/remotes/origin/HEAD", "")
+            if origin_head.startswith("refs/remotes/origin/"):
+                default_branch = origin_head[len("refs/remotes/origin/") :]
+            elif "refs/heads/main" in refs:
+                default_branch = "main"
+            elif "refs/heads/master" in refs:
+                default_branch = "master"
+            else:
+                default_branch = None
             if not default_branch:
                 ui.error("Unable to determine default branch while in detached HEAD.")
                 if logger:
                     logger.error("Cannot determine default branch")
                 return {"failed": True}
-            git_run(repo_path, "checkout", default_branch, env=git_env)
+            git_run(repo_path, "switch", default_branch, env=git_env, capture=False)
             original_branch = default_branch
             if logger:
                 logger.info("Detached HEAD → switched to '%s'", default_branch)
@@ -303,6 +485,7 @@ def handle_git_operations(
         default_branch_name, timestamp_str = generate_branch_name(
             branch_format_str,
             design_basename_for_branch,
+            timestamp=started_at.strftime("%Y%m%d-%H%M%S"),
         )
         branch_name_final = default_branch_name
         reused_branch = False
@@ -345,7 +528,8 @@ def handle_git_operations(
             branch_name_final = candidate
 
         if reused_branch:
-            git_run(repo_path, "checkout", branch_name_final, env=git_env)
+            git_run(repo_path, "switch", branch_name_final, env=git_env, capture=False)
+            switched_branch = True
             # The local branch may be behind origin (e.g. pushed to from
             # another machine); sync it so the export lands on the remote
             # tip instead of the push being rejected as non-fast-forward.
@@ -379,49 +563,40 @@ def handle_git_operations(
                         pull_failure_details = details
                         raise
         else:
-            git_run(repo_path, "checkout", "-b", branch_name_final, env=git_env)
+            git_run(repo_path, "switch", "-c", branch_name_final, env=git_env, capture=False)
+            switched_branch = True
 
         # Only now — with the stash/pull steps done and the export branch
         # checked out — do the export files enter the working tree.
         files_to_commit = [os.path.normpath(p) for p in (file_abs_paths_to_add or [])]
         if materialize_files is not None:
             files_to_commit = [os.path.normpath(p) for p in (materialize_files() or [])]
+        # Paths inside the repo just lose the repo prefix; relpath is only
+        # needed for anything else. Used for both the changelog and git add.
+        repo_prefix = os.path.join(os.path.normpath(repo_path), "")
+        rels_to_commit = [
+            p[len(repo_prefix) :] if p.startswith(repo_prefix) else os.path.relpath(p, repo_path)
+            for p in files_to_commit
+        ]
 
         changelog_file_path = os.path.join(repo_path, "CHANGELOG.md")
-        log_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        commit_msg = commit_msg_template or "Design update: {filename}"
-        commit_msg = (
-            commit_msg.replace("{filename}", design_basename_for_branch)
-            .replace("{branch}", branch_name_final)
-            .replace("{timestamp}", timestamp_str)
+        log_timestamp = started_at.strftime("%Y-%m-%d %H:%M:%S")
+        commit_msg = _fill_template(
+            commit_msg_template or "Design update: {filename}",
+            {"filename": design_basename_for_branch, "branch": branch_name_final, "timestamp": timestamp_str},
         )
 
-        entry_lines = [
-            f"## {log_timestamp} - {design_basename_for_branch}",
-            f"- **Branch:** `{branch_name_final}`",
-            f'- **Commit Message:** "{commit_msg}"',
-        ]
-        if files_to_commit:
-            entry_lines.append("- **Files Updated:**")
-            for f in files_to_commit:
-                try:
-                    rel_display = os.path.relpath(f, repo_path)
-                except Exception:
-                    rel_display = os.path.basename(f)
-                entry_lines.append(f"  - `{rel_display}`")
-        entry_lines.append("\n---\n")
-
-        changelog_header = "# Changelog\n\n"
-        existing = ""
-        if os.path.exists(changelog_file_path):
-            with open(changelog_file_path, "r", encoding="utf-8") as fr:
-                existing = fr.read()
-            if existing.startswith(changelog_header):
-                existing = existing[len(changelog_header) :]
-        with open(changelog_file_path, "w", encoding="utf-8") as fw:
-            fw.write(changelog_header)
-            fw.write("\n".join(entry_lines) + "\n")
-            fw.write(existing)
+        def _entry_lines():
+            yield f"## {log_timestamp} - {design_basename_for_branch}"
+            yield f"- **Branch:** `{branch_name_final}`"
+            yield f'- **Commit Message:** "{commit_msg}"'
+            if rels_to_commit:
+                yield "- **Files Updated:**"
+                for rel in rels_to_commit:
+                    yield f"  - `{rel}`"
+            yield "\n---\n"
+
+        _prepend_changelog_entry(changelog_file_path, "# Changelog\n\n", _entry_lines())
 
         files_abs = [os.path.join(repo_path, "CHANGELOG.md")] + files_to_commit
         missing = [p for p in files_abs if not os.path.exists(p)]
@@ -438,18 +613,14 @@ def handle_git_operations(
                 logger.error(msg)
             return {"failed": True}
 
-        rels = ["CHANGELOG.md"]
-        for p in files_to_commit:
-            rels.append(os.path.relpath(p, repo_path))
-
-        git_run(repo_path, "add", *rels, env=git_env)
+        git_run(repo_path, "add", "CHANGELOG.md", *rels_to_commit, env=git_env, capture=False)
         git_run(repo_path, "commit", "-m", commit_msg, env=git_env)
 
         push_args = ["push"]
         if skip_pull:
             push_args.append("--force-with-lease")
         push_args.extend(["-u", "origin", branch_name_final])
-        git_run(repo_path, *push_args, env=git_env)
+        git_run(repo_path, *push_args, env=git_env, capture=False)
 
         return {
             "branch": branch_name_final,
@@ -460,13 +631,15 @@ def handle_git_operations(
             "reused_branch": reused_branch,
         }
 
+    # Build the subprocess environment once for every git call below.
+    base_env = _build_git_env()
     try:
         if pat_credentials and pat_credentials.get("token"):
             username = pat_credentials.get("username", "")
             with git_askpass_env(username, pat_credentials.get("token", "")) as env_map:
-                result = _perform(env_map)
+                result = _perform(_build_git_env(env_map))
         else:
-            result = _perform(None)
+            result = _perform(base_env)
         if result and result.get("failed"):
             return None
         return result
@@ -479,15 +652,25 @@ def handle_git_operations(
     finally:
         restore_ok = False
         try:
-            if original_branch:
+            if original_branch and (not switched_branch or branch_name_final == original_branch):
+                restore_ok = True
+            elif original_branch:
                 branch_exists = (
                     git_run(
-                        repo_path, "rev-parse", "--verify", "-q", f"refs/heads/{original_branch}", check=False
+                        repo_path,
+                        "rev-parse",
+                        "--verify",
+                        "-q",
+                        f"refs/heads/{original_branch}",
+                        check=False,
+                        env=base_env,
                     ).returncode
                     == 0
                 )
                 if branch_exists:
-                    restore_proc = git_run(repo_path, "checkout", original_branch, check=False)
+                    restore_proc = git_run(
+                        repo_path, "switch", original_branch, check=False, env=base_env, capture=False
+                    )
                     restore_ok = restore_proc.returncode == 0
                     if not restore_ok:
                         msg = (
@@ -512,7 +695,7 @@ def handle_git_operations(
         if stashed:
             try:
                 stash_ref = None
-                stash_list = git_run(repo_path, "stash", "list", check=False)
+                stash_list = git_run(repo_path, "stash", "list", check=False, env=base_env)
                 for line in (stash_list.stdout or "").splitlines():
                     if our_stash_msg in line:
                         stash_ref = line.split(":", 1)[0].strip()
@@ -531,7 +714,7 @@ def handle_git_operations(
                     if logger:
                         logger.warning(msg)
                 else:
-                    pop_proc = git_run(repo_path, "stash", "pop", stash_ref, check=False)
+                    pop_proc = git_run(repo_path, "stash", "pop", stash_ref, check=False, env=base_env)
                     if pop_proc.returncode != 0:
                         msg = (
                             f"Your auto-stashed local changes could not be restored automatically and "
@@ -550,7 +733,6 @@ def handle_git_operations(
 __all__ = [
     "VERSION",
     "IS_WINDOWS",
-    "GIT_EXE",
     "GitUI",
     "sanitize_branch_name",
     "generate_branch_name",
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import argparse
-import logging
 import os
-import shutil
 import sys
-import tempfile
-from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    import argparse
 
 # Import core functions - handle both standalone and installed scenarios
 try:
@@ -33,12 +32,27 @@ except ImportError:
     )
 
 
+_YES = frozenset(("y", "yes"))
+
+
 class TerminalUI(GitUI):
+    """GitUI that prints to stdout.
+
+    Messages are buffered and written in one go by ``flush()``, which runs
+    before every interactive prompt and at the end of ``main``.
+    """
+
     def __init__(self, *, assume_yes: bool = False):
         self._assume_yes = assume_yes
+        self._pending: list[str] = []
 
     def _write(self, prefix: str, message: str) -> None:
-        sys.stdout.write(f"[{prefix}] {message}\n")
+        self._pending.append(f"[{prefix}] {message}\n")
+
+    def flush(self) -> None:
+        if self._pending:
+            sys.stdout.write("".join(self._pending))
+            self._pending.clear()
         sys.stdout.flush()
 
     def info(self, message: str) -> None:
@@ -55,26 +69,98 @@ class TerminalUI(GitUI):
             self._write("CONFIRM", f"{message} -> yes (assumed)")
             return True
         prompt = f"{message} [y/N]: "
+        self.flush()
         try:
             response = input(prompt)
         except EOFError:
             return False
-        accepted = response.strip().lower() in {"y", "yes"}
+        # Only "y"/"yes" (possibly padded) can be accepted; skip normalising
+        # anything that cannot match.
+        accepted = (
+            bool(response)
+            and (response[0] in "yY" or response[0].isspace())
+            and response.strip().lower() in _YES
+        )
         self._write("CONFIRM", f"{message} -> {'yes' if accepted else 'no'}")
         return accepted
 
 
-def _abs_paths(repo: Path, entries: list[str]) -> list[str]:
+def _abs_paths(repo_root: str, entries: list[str]) -> list[str]:
+    # repo_root is already resolved (see main); repo-relative entries are
+    # joined onto it lexically. Absolute entries are still resolved, since
+    # they may reach the repo through a symlink and must end up under the
+    # resolved root for the pipeline's relative paths.
     resolved: list[str] = []
     for entry in entries:
-        path = Path(entry)
-        if not path.is_absolute():
-            path = repo / path
-        resolved.append(str(path.resolve()))
+        if os.path.isabs(entry):
+            resolved.append(os.path.realpath(entry))
+        else:
+            resolved.append(os.path.normpath(os.path.join(repo_root, entry)))
     return resolved
 
 
-def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+def _split_existing(paths: list[str]) -> tuple[list[str], list[str]]:
+    """Split *paths* into (existing, missing), keeping their order.
+
+    Each parent directory is listed once instead of stat-ing every path.
+    Names not found in the listing (case-insensitive file systems) and
+    symlinks (which may dangle) are confirmed with os.path.exists.
+    """
+    listings: dict[str, dict] = {}
+    present: list[str] = []
+    missing: list[str] = []
+    for path in paths:
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as it:
+                    listings[parent] = {entry.name: entry for entry in it}
+            except OSError:
+                listings[parent] = {}
+        entry = listings[parent].get(name)
+        if entry is not None and not entry.is_symlink():
+            exists = True
+        else:
+            exists = os.path.exists(path)
+        (present if exists else missing).append(path)
+    return present, missing
+
+
+# Numeric values of the logging levels, so parsing does not need to import
+# logging.
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+LOG_LEVEL_CHOICES = tuple(_LEVELS)
+
+# Option tables for the fast parser in _parse_args; they must mirror
+# build_parser().
+_VALUE_OPTIONS = {
+    "--repo": "repo",
+    "--commit-template": "commit_template",
+    "--branch-template": "branch_template",
+    "--branch-override": "branch_override",
+    "--design-name": "design_name",
+    "--pat-token": "pat_token",
+    "--pat-username": "pat_username",
+    "--log-level": "log_level",
+}
+_FLAG_OPTIONS = {"--skip-pull": "skip_pull", "--assume-yes": "assume_yes"}
+_DEFAULTS = {
+    "repo": None,
+    "commit_template": "Design update: {filename}",
+    "branch_template": "fusion-export/{filename}-{timestamp}",
+    "branch_override": None,
+    "design_name": "OfflineDesign",
+    "skip_pull": False,
+    "assume_yes": False,
+    "pat_token": None,
+    "pat_username": "",
+    "log_level": "INFO",
+}
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=("Run the FusionToGitHub git pipeline outside Fusion for smoke testing " "and CI automation.")
     )
@@ -87,40 +173,94 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--commit-template",
-        default="Design update: {filename}",
+        default=_DEFAULTS["commit_template"],
         help="Commit message template; supports {filename}, {branch}, {timestamp}",
     )
     parser.add_argument(
         "--branch-template",
-        default="fusion-export/{filename}-{timestamp}",
+        default=_DEFAULTS["branch_template"],
         help="Branch name template; supports {filename} and {timestamp}",
     )
     parser.add_argument("--branch-override", help="Explicit branch name to use instead of template")
-    parser.add_argument("--design-name", default="OfflineDesign", help="Name used for placeholder tokens")
+    parser.add_argument("--design-name", default=_DEFAULTS["design_name"], help="Name used for placeholder tokens")
     parser.add_argument("--skip-pull", action="store_true", help="Skip git pull --rebase and force push")
     parser.add_argument("--assume-yes", action="store_true", help="Auto-accept confirmation prompts")
     parser.add_argument("--pat-token", help="Personal access token to feed via askpass")
     parser.add_argument("--pat-username", default="", help="Username to pair with the PAT (if required)")
     parser.add_argument(
         "--log-level",
-        default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default=_DEFAULTS["log_level"],
+        choices=LOG_LEVEL_CHOICES,
         help="Logging verbosity for the CLI harness",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def _fast_parse(args: list[str]) -> Optional[SimpleNamespace]:
+    """Parse a well-formed command line, or return None to defer to argparse."""
+    values = dict(_DEFAULTS, files=[])
+    index = 0
+    while index < len(args):
+        token = args[index]
+        index += 1
+        if not token.startswith("--"):
+            return None
+        flag, has_inline, inline = token.partition("=")
+        if flag in _FLAG_OPTIONS and not has_inline:
+            values[_FLAG_OPTIONS[flag]] = True
+        elif flag == "--files" and not has_inline:
+            start = index
+            while index < len(args) and not args[index].startswith("-"):
+                index += 1
+            values["files"] = args[start:index]
+        elif flag in _VALUE_OPTIONS:
+            if has_inline:
+                values[_VALUE_OPTIONS[flag]] = inline
+            elif index < len(args) and not args[index].startswith("-"):
+                values[_VALUE_OPTIONS[flag]] = args[index]
+                index += 1
+            else:
+                return None
+        else:
+            return None
+    if values["repo"] is None or values["log_level"] not in LOG_LEVEL_CHOICES:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> Union[SimpleNamespace, "argparse.Namespace"]:
+    """Parse the command line.
+
+    Well-formed command lines go through a small loop, so a normal run never
+    builds the argparse parser. Everything else (--help, abbreviations,
+    missing values, invalid choices, ...) is handed to build_parser(), which
+    keeps argparse's usage and error messages.
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+    parsed = _fast_parse(args)
+    if parsed is None:
+        parsed = build_parser().parse_args(args)
+    parsed.log_level_int = _LEVELS[parsed.log_level]
+    return parsed
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = _parse_args(argv)
 
-    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+    # Only a real run needs these; --help and argument errors exit above.
+    import logging
+    import shutil
+    import tempfile
+
+    logging.basicConfig(level=args.log_level_int)
     logger = logging.getLogger("FusionToGitHub.CLI")
 
-    repo_path = Path(args.repo).expanduser().resolve()
-    if not repo_path.exists():
+    repo_path = os.path.realpath(os.path.expanduser(args.repo))
+    if not os.path.isdir(repo_path):
         sys.stderr.write(f"Repository path not found: {repo_path}\n")
         return 2
-    if not (repo_path / ".git").exists():
+    # exists rather than isdir: worktrees and submodules have a .git file.
+    if not os.path.exists(os.path.join(repo_path, ".git")):
         sys.stderr.write(f"No .git directory detected at {repo_path}\n")
         return 2
 
@@ -132,12 +272,12 @@ def main(argv: Optional[list[str]] = None) -> int:
     if not files_to_add:
         logger.info("No file list provided; only CHANGELOG.md will be committed if changed.")
     else:
-        missing = [p for p in files_to_add if not os.path.exists(p)]
+        present, missing = _split_existing(files_to_add)
         if missing:
             sys.stderr.write("The following files do not exist and will be skipped:\n")
             for entry in missing:
                 sys.stderr.write(f"  - {entry}\n")
-            files_to_add = [p for p in files_to_add if os.path.exists(p)]
+            files_to_add = present
 
     ui = TerminalUI(assume_yes=args.assume_yes)
     pat_credentials = None
@@ -168,7 +308,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     logger.info("FusionToGitHub CLI harness %s", VERSION)
     try:
         result = handle_git_operations(
-            str(repo_path),
+            repo_path,
             [],
             args.commit_template,
             args.branch_template,
@@ -181,6 +321,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             materialize_files=materialize,
         )
     finally:
+        ui.flush()
         if snapshot_dir:
             shutil.rmtree(snapshot_dir, ignore_errors=True)
 
@@ -191,19 +332,16 @@ def main(argv: Optional[list[str]] = None) -> int:
         sys.stdout.write("Push cancelled by user; nothing was pushed.\n")
         return 3
 
-    summary = [
-        "Push completed via CLI harness:",
-        f"  • Branch: {result.get('branch')}",
-    ]
+    summary = [f"Push completed via CLI harness:\n  • Branch: {result.get('branch')}\n"]
     if result.get("reused_branch"):
-        summary.append("  • Added a new commit to the existing branch")
+        summary.append("  • Added a new commit to the existing branch\n")
     if result.get("force_push"):
-        summary.append("  • Force push was used (--force-with-lease)")
+        summary.append("  • Force push was used (--force-with-lease)\n")
     if result.get("stashed"):
-        summary.append("  • Local changes were auto-stashed and restored")
+        summary.append("  • Local changes were auto-stashed and restored\n")
     if result.get("pull_failed"):
-        summary.append("  • Pull failed before force push; inspect logs")
-    sys.stdout.write("\n".join(summary) + "\n")
+        summary.append("  • Pull failed before force push; inspect logs\n")
+    sys.stdout.write("".join(summary))
     return 0
 
 